@@ -1,18 +1,17 @@
 # Configuration file for the Sphinx documentation builder.
 from __future__ import annotations
 
+import importlib.metadata
 import sys
 from pathlib import Path
 
-from pkg_resources import get_distribution
-
 sys.path.insert(0, Path(__file__).parents[2].resolve().as_posix())
 # Add local extension directory.
 sys.path.insert(0, (Path(__file__).parents[0] / "exts").as_posix())
 
 project = "legend-pygeom-optics"
 copyright = "The LEGEND Collaboration"
-version = get_distribution("legend-pygeom-optics").version
+version = importlib.metadata.version("legend-pygeom-optics")
 
 extensions = [
     "sphinx.ext.githubpages",
@@ -70,5 +69,11 @@ autoclass_content = "both"
 autodoc_typehints = "description"
 autodoc_typehints_description_target = "all"
 autodoc_typehints_format = "short"
-# mock pyg4ometry that will sometimes lead to build failures.
-autodoc_mock_imports = ["pyg4ometry"]
+# mock pyg4ometry only if it cannot be imported, as it will sometimes lead to build
+# failures. autodoc imports it anyway for legendoptics.pyg4utils.
+try:
+    import pyg4ometry  # noqa: F401
+
+    autodoc_mock_imports = []
+except ImportError:
+    autodoc_mock_imports = ["pyg4ometry"]
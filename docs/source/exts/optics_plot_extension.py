@@ -1,63 +1,111 @@
 from __future__ import annotations
 
 import ast
+import functools
+import hashlib
 import inspect
+import json
+import os
+import pickle
+import re
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Callable
 
-import matplotlib.pyplot as plt
-import numpy as np
-import pint
 from sphinx.application import Sphinx
 
-u = pint.get_application_registry()
+# output directory for plots, relative to the sphinx source dir. It is not placed in the
+# api directory (that is always re-generated), so that the plots can be reused.
+PLOTS_DIR = "_optics_plots"
+
+_pending_plots: list[Future] = []
+# whether to skip a documented object, by its fully qualified name and kind.
+_skip_cache: dict[tuple[str, str], bool] = {}
+# custom tokens in docstrings, that will be replaced by the output of this extension.
+_DIRECTIVE_RE = re.compile(r"^\.\. optics-(plot|const)::(.*)$", re.MULTILINE)
+# characters not allowed in plot file names.
+_UNSAFE_NAME_RE = re.compile(r"[^\w.-]")
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_plot_options(opt_string: str) -> dict[str, Any]:
+    """Parse the options of an ``optics-plot`` token, either as JSON or Python literal."""
+    if opt_string.strip() == "":
+        return {}
+    try:
+        opts = json.loads(opt_string)
+    except ValueError:
+        opts = ast.literal_eval(opt_string.strip())
+    assert isinstance(opts, dict)
+    return opts
+
+
+@functools.cache
+def _package_digest() -> bytes:
+    """Hash of the installed ``legendoptics`` version and all its source and data files.
+
+    Plotted functions might depend on any other module or data file of the package.
+    """
+    import legendoptics
+
+    h = hashlib.blake2b(digest_size=8)
+    h.update(legendoptics.__version__.encode())
+    root = Path(legendoptics.__file__).parent
+    for f in sorted(root.rglob("*")):
+        if (
+            not f.is_file()
+            or "__pycache__" in f.parts
+            or f.suffix in (".pyc", ".nbi", ".nbc")
+        ):
+            continue
+        h.update(f.relative_to(root).as_posix().encode())
+        h.update(f.read_bytes())
+    return h.digest()
+
+
+def _plot_cache_key(name: str, options: dict[str, Any]) -> str:
+    """Hash of the whole package, the plotted function's name and the plot options.
+
+    Used to skip unchanged plots.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    h.update(_package_digest())
+    h.update(name.encode())
+    h.update(repr(options).encode())
+    return h.hexdigest()
 
 
-def do_plot(
-    obj: Callable, plots_dir: Path, safe_name: str, options: dict[str, Any]
-) -> list[str]:
-    """Create a plot from the given optical property function.
+@functools.cache
+def _wavelength_grid(start_nm: float, stop_nm: float) -> Any:
+    """Read-only grid of 200 wavelengths, used for properties that take an x vector."""
+    import numpy as np
+    import pint
 
-    By default, it will call ``obj()`` and unpack the result into an x-vector, and multiple
-    y-vectors. All y-vectors will pe plotted together into one output file.
+    u = pint.get_application_registry()
+    x = np.linspace(start_nm * u.nm, stop_nm * u.nm, num=200)
+    x.m.flags.writeable = False
+    return x
 
-    Other Parameters
-    ----------------
-    options
-        Change the behaviour of the plot.
 
-        xlim
-            Set the plot's x axis limits, see :py:func:`matplotlib.pyplot.xlim`
-        ylim
-            Set the plot's y axis limits, see :py:func:`matplotlib.pyplot.ylim`
-        xscale
-            Set the plot's x axis scaling, see :py:func:`matplotlib.pyplot.xscale`
-        yscale
-            Set the plot's y axis scaling, see :py:func:`matplotlib.pyplot.yscale`
-        labels
-            Tuple of labels that will be applied if more than one y vector is returned.
-        call_x
-            Differing from the default behavior above, the function will be called with an
-            x vector of wavelengths in the optical range (as :py:class:`pint.Quantity`).
-            All return values are interpreted as y vectors.
-        standalone
-            if True, do not output the return value preamble (i.e. to embed more than one plot)
-        ret_offset
-            use the argument numbered by this (default: 0) as the first argument that will
-            be treated as an x or y vector.
+def plot_callable(obj: Callable, plot_file: Path, options: dict[str, Any]) -> None:
+    """Render the plot for the given optical property function to `plot_file`.
+
+    See :func:`do_plot` for the supported `options`.
     """
-    # init plot
-    fig = plt.figure(figsize=(4, 2))
-    ax = plt.gca()
-    plt.grid()
+    # import the heavy plotting dependencies only when a plot needs to be rendered.
+    import pint
+    from matplotlib.figure import Figure
+
+    # init plot. Use a standalone figure (not managed by pyplot), that does not need to
+    # be closed and is always rendered with the Agg backend.
+    fig = Figure(figsize=(4, 2))
+    ax = fig.add_subplot()
+    ax.grid()
 
     ret_offset = options.get("ret_offset", 0)
     if "call_x" in options:
         # special case for LAr properties
-        lim = [112 * u.nm, 650 * u.nm]
-        if "xlim" in options:
-            lim = [xl * u.nm for xl in options["xlim"]]
-        x = np.linspace(*lim, num=200)
+        x = _wavelength_grid(*options.get("xlim", (112, 650)))
         ys = obj(x)
         ys = ys[ret_offset:]
         # wrap the result in a tuple, if needed
@@ -72,20 +120,22 @@ def do_plot(
         ax.set_xlabel(x.u)
         x = x.magnitude
 
-    # plot all supplied data vectors
-    for i, val in enumerate(ys):
-        if isinstance(val, pint.Quantity):
-            ax.set_ylabel(val.u)
-            y = val.magnitude
+    # all y vectors share one axis, so label it with the unit of the first one.
+    y_units = [val.u for val in ys if isinstance(val, pint.Quantity)]
+    if y_units:
+        ax.set_ylabel(y_units[0])
+    ys_m = [val.magnitude if isinstance(val, pint.Quantity) else val for val in ys]
 
+    # plot all supplied data vectors
+    for i, y in enumerate(ys_m):
         plotoptions = {}
         if "labels" in options:
             plotoptions["label"] = options["labels"][i]
 
-        plt.plot(x, y, marker=".", markersize=2, linewidth=0.5, **plotoptions)
+        ax.plot(x, y, marker=".", markersize=2, linewidth=0.5, **plotoptions)
 
     if len(ys) > 1 and "labels" in options:
-        plt.legend()
+        ax.legend()
 
     # adjust plotting options
     if "ylim" in options:
@@ -99,16 +149,89 @@ def do_plot(
 
     # export figure to the filesystem
     fig.tight_layout(pad=0.3)
-    fig.savefig(plots_dir / (safe_name + ".png"), dpi=300)
+    # the plots are shown with 400px width, so 800px is sufficient also for high-DPI
+    # displays. Fast compression is preferred over the (slightly) smaller file size.
+    fig.savefig(plot_file, dpi=200, pil_kwargs={"compress_level": 1})
+
+
+@functools.cache
+def _get_plot_executor(pid: int) -> ProcessPoolExecutor:
+    """Process pool for rendering plots, one per (forked) sphinx process."""
+    return ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+def _submit_plot(obj: Callable, plot_file: Path, options: dict[str, Any]) -> None:
+    """Render the plot in a worker process, or synchronously if `obj` cannot be pickled."""
+    try:
+        pickle.dumps((obj, options))
+    except (pickle.PicklingError, AttributeError, TypeError):
+        plot_callable(obj, plot_file, options)
+        return
+
+    # sphinx forks its own processes for parallel reading, that cannot use the pool of
+    # their parent process.
+    executor = _get_plot_executor(os.getpid())
+    _pending_plots.append(executor.submit(plot_callable, obj, plot_file, options))
+
+
+def _wait_for_plots(app: Sphinx, _: Any) -> None:
+    """Wait for all pending plots, i.e. before sphinx checks the image files of a document."""
+    while _pending_plots:
+        _pending_plots.pop().result()
+
 
-    plt.close()
+def do_plot(
+    obj: Callable, plots_dir: Path, safe_name: str, options: dict[str, Any]
+) -> list[str]:
+    """Create a plot from the given optical property function.
+
+    By default, it will call ``obj()`` and unpack the result into an x-vector, and multiple
+    y-vectors. All y-vectors will pe plotted together into one output file.
+
+    The output file name contains a hash of the package sources and data files, of the
+    function name and of the options; if such a file already exists, the plot is not
+    regenerated. Otherwise, the plot is rendered asynchronously in a separate process.
+
+    Other Parameters
+    ----------------
+    options
+        Change the behaviour of the plot.
+
+        xlim
+            Set the plot's x axis limits, see :py:func:`matplotlib.pyplot.xlim`
+        ylim
+            Set the plot's y axis limits, see :py:func:`matplotlib.pyplot.ylim`
+        xscale
+            Set the plot's x axis scaling, see :py:func:`matplotlib.pyplot.xscale`
+        yscale
+            Set the plot's y axis scaling, see :py:func:`matplotlib.pyplot.yscale`
+        labels
+            Tuple of labels that will be applied if more than one y vector is returned.
+        call_x
+            Differing from the default behavior above, the function will be called with an
+            x vector of wavelengths in the optical range (as :py:class:`pint.Quantity`).
+            All return values are interpreted as y vectors.
+        standalone
+            if True, do not output the return value preamble (i.e. to embed more than one plot)
+        ret_offset
+            use the argument numbered by this (default: 0) as the first argument that will
+            be treated as an x or y vector.
+    """
+    plot_name = f"{safe_name}.{_plot_cache_key(safe_name, options)}.png"
+    plot_file = plots_dir / plot_name
+
+    if not plot_file.exists():
+        # remove stale plots of previous versions of this function.
+        for stale in plots_dir.glob(f"{safe_name}.*.png"):
+            stale.unlink()
+        _submit_plot(obj, plot_file, options)
 
     lines = []
     if not options.get("standalone", False):
         lines += [":returns:"]
     return [
         *lines,
-        f"    .. image:: plots/{safe_name}.png",
+        f"    .. image:: /{PLOTS_DIR}/{plot_name}",
         "        :width: 400px",
     ]
 
@@ -118,6 +241,8 @@ def do_const(obj: Callable) -> list[str]:
 
     By default, it will call ``obj()`` and display the numerical value of the return value.
     """
+    import pint
+
     const = obj()
     description = None
 
@@ -143,47 +268,53 @@ def process_docstring(
     options: Any,
     lines: list[str],
 ) -> None:
-    if inspect.isclass(obj) or what != "function":
+    skip = _skip_cache.get((name, what))
+    if skip is None:
+        skip = inspect.isclass(obj) or what != "function" or not callable(obj)
+        _skip_cache[(name, what)] = skip
+    if skip:
         return
-    if not callable(obj):
-        return
-
-    plots_dir = Path(app.srcdir) / "api" / "plots"
 
     # this only appears to be a sphix directive, but the parsing here is very simple.
-    plot_token = ".. optics-plot::"
-    const_token = ".. optics-const::"
+    text = "\n".join(lines)
+    matches = list(_DIRECTIVE_RE.finditer(text))
+    # fast path for the majority of docstrings without any of our tokens.
+    if not matches:
+        return
 
-    i = 0
+    plots_dir = Path(app.srcdir) / PLOTS_DIR
+
+    replacements = []
     plot_idx = 0
-    orig_lines = lines.copy()
-    for line in orig_lines:
-        if line.startswith(plot_token):
+    line_idx = 0
+    last_pos = 0
+    for m in matches:
+        line_idx += text.count("\n", last_pos, m.start())
+        last_pos = m.start()
+
+        if m.group(1) == "plot":
             plots_dir.mkdir(exist_ok=True, parents=True)
-            safe_name = "".join(c for c in name if c.isalnum() or c in (".", "-", "_"))
-            safe_name += f"_{plot_idx}"
+            safe_name = _UNSAFE_NAME_RE.sub("", name) + f"_{plot_idx}"
 
-            opt_string = line[len(plot_token) :]
-            opts = {}
-            if opt_string != "":
-                opts = ast.literal_eval(opt_string)
-            assert isinstance(opts, dict)
+            # copy the cached options, they might be modified down the line.
+            opts = dict(_parse_plot_options(m.group(2)))
 
             # replace the custom 'directive' with an actually supported reST directive.
-            replace = do_plot(obj, plots_dir, safe_name, opts)
-            lines[i : i + 1] = replace
-            i += len(replace)
+            replacements.append((line_idx, do_plot(obj, plots_dir, safe_name, opts)))
             plot_idx += 1
-        elif line.startswith(const_token):
-            # replace the custom 'directive' with actually supported reST content.
-            replace = do_const(obj)
-            lines[i : i + 1] = replace
-            i += len(replace)
         else:
-            i += 1
+            # replace the custom 'directive' with actually supported reST content.
+            replacements.append((line_idx, do_const(obj)))
+
+    # replace from the end, so that the indices of the remaining lines stay valid.
+    for i, replace in reversed(replacements):
+        lines[i : i + 1] = replace
 
 
 def setup(app: Sphinx) -> dict[str, bool]:
     """Register this sphinx extension."""
     app.connect("autodoc-process-docstring", process_docstring)
-    return {"parallel_read_safe": True}
+    # the image collector of sphinx (with default priority 500) needs the plot files.
+    app.connect("doctree-read", _wait_for_plots, priority=400)
+    app.connect("build-finished", _wait_for_plots)
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
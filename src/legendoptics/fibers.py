@@ -18,6 +18,9 @@ from legendoptics.utils import InterpolatingGraph, readdatafile
 log = logging.getLogger(__name__)
 u = pint.get_application_registry()
 
+# reference wavelength of the absorption length scaling, to avoid constructing it on each call.
+_λ_400NM = 400 * u.nm
+
 
 @store.register_pluggable
 def fiber_cladding2_refractive_index() -> float:
@@ -77,7 +80,9 @@ def fiber_wls_absorption(
     wvl, absorp = readdatafile("psfibers_wlsabslength.dat")  # arbitrary unit
     assert str(absorp.dimensionality) == "dimensionless"
     # scale factor for absorption lengths (abslength is 0.7mm at 400nm, see above)
-    absorp *= abs_at_400nm / InterpolatingGraph(wvl, absorp)(400 * u.nm)
+    # the data points are sorted by wavelength, so np.interp can be used directly.
+    absorp_at_400nm = np.interp(_λ_400NM.m_as(wvl.u), wvl.m, absorp.m) * absorp.u
+    absorp = absorp * (abs_at_400nm / absorp_at_400nm)
     return wvl, absorp
 
 
@@ -136,10 +141,13 @@ def pyg4_fiber_cladding1_attach_rindex(mat, reg) -> None:
     --------
     .fiber_cladding1_refractive_index
     """
-    λ = np.array([650.0, 115.0]) * u.nm
-    r = [fiber_cladding1_refractive_index()] * 2
-    with u.context("sp"):
-        mat.addVecPropertyPint("RINDEX", λ.to("eV"), r)
+    from legendoptics.pyg4utils import _RINDEX_E
+
+    mat.addVecPropertyPint(
+        "RINDEX",
+        _RINDEX_E,
+        np.full(_RINDEX_E.shape, fiber_cladding1_refractive_index()),
+    )
 
 
 def pyg4_fiber_cladding2_attach_rindex(mat, reg) -> None:
@@ -149,10 +157,13 @@ def pyg4_fiber_cladding2_attach_rindex(mat, reg) -> None:
     --------
     .fiber_cladding2_refractive_index
     """
-    λ = np.array([650.0, 115.0]) * u.nm
-    r = [fiber_cladding2_refractive_index()] * 2
-    with u.context("sp"):
-        mat.addVecPropertyPint("RINDEX", λ.to("eV"), r)
+    from legendoptics.pyg4utils import _RINDEX_E
+
+    mat.addVecPropertyPint(
+        "RINDEX",
+        _RINDEX_E,
+        np.full(_RINDEX_E.shape, fiber_cladding2_refractive_index()),
+    )
 
 
 def pyg4_fiber_core_attach_rindex(mat, reg) -> None:
@@ -162,10 +173,11 @@ def pyg4_fiber_core_attach_rindex(mat, reg) -> None:
     --------
     .fiber_core_refractive_index
     """
-    λ = np.array([650.0, 115.0]) * u.nm
-    r = [fiber_core_refractive_index()] * 2
-    with u.context("sp"):
-        mat.addVecPropertyPint("RINDEX", λ.to("eV"), r)
+    from legendoptics.pyg4utils import _RINDEX_E
+
+    mat.addVecPropertyPint(
+        "RINDEX", _RINDEX_E, np.full(_RINDEX_E.shape, fiber_core_refractive_index())
+    )
 
 
 def pyg4_fiber_core_attach_wls(
@@ -181,18 +193,17 @@ def pyg4_fiber_core_attach_wls(
     .fiber_wls_emission
     .fiber_wls_timeconstant
     """
-    from legendoptics.pyg4utils import pyg4_sample_λ
+    from legendoptics.pyg4utils import _pyg4_sample_λ_e
 
-    λ_full = pyg4_sample_λ(112 * u.nm, 650 * u.nm)
+    λ_full, e_full = _pyg4_sample_λ_e(112 * u.nm, 650 * u.nm)
     absorption = InterpolatingGraph(*fiber_wls_absorption())(λ_full)
     emission = InterpolatingGraph(*fiber_wls_emission())(λ_full)
     # make sure that the scintillation spectrum is zero at the boundaries.
     emission[0] = 0
     emission[-1] = 0
 
-    with u.context("sp"):
-        mat.addVecPropertyPint("WLSABSLENGTH", λ_full.to("eV"), absorption)
-        mat.addVecPropertyPint("WLSCOMPONENT", λ_full.to("eV"), emission)
+    mat.addVecPropertyPint("WLSABSLENGTH", e_full, absorption)
+    mat.addVecPropertyPint("WLSCOMPONENT", e_full, emission)
 
     mat.addConstPropertyPint("WLSTIMECONSTANT", fiber_wls_timeconstant())
 
@@ -212,14 +223,13 @@ def pyg4_fiber_core_attach_absorption(
     --------
     .fiber_absorption_path_length
     """
-    from legendoptics.pyg4utils import pyg4_sample_λ
+    from legendoptics.pyg4utils import _pyg4_sample_λ_e
 
-    λ_full = pyg4_sample_λ(112 * u.nm, 650 * u.nm)
+    λ_full, e_full = _pyg4_sample_λ_e(112 * u.nm, 650 * u.nm)
     length = (
         fiber_absorption_path_length()
         if use_geometrical_absorption
         else fiber_absorption_length()
     )
-    absorption = np.array([length.m] * λ_full.shape[0]) * length.u
-    with u.context("sp"):
-        mat.addVecPropertyPint("ABSLENGTH", λ_full.to("eV"), absorption)
+    absorption = u.Quantity(np.full(λ_full.shape, length.m, dtype=np.float64), length.u)
+    mat.addVecPropertyPint("ABSLENGTH", e_full, absorption)
@@ -27,7 +27,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import math
 from typing import Literal, NamedTuple
 
 import numpy as np
@@ -48,6 +50,35 @@ u = pint.get_application_registry()
 ArDielectricMethods = Literal["cern2020", "bideau-mehu"]
 ArLifetimeMethods = Literal["legend200-llama"]
 
+_LENGTH_DIM = u.get_dimensionality("[length]")
+
+
+# Sellmeier coefficients (for λ in µm) of the Bideau-Mehu formula.
+_BIDEAU_MEHU_A = (0.2075, 0.0415, 4.3330)
+_BIDEAU_MEHU_B = (91.012, 87.892, 214.02)
+# prefactor of the Bideau-Mehu formula, including Bideau-Sellmeier -> Clausius-Mossotti
+# (2/3) and the density correction (Ar gas -> LAr liquid).
+_BIDEAU_MEHU_SCALE = 1.2055e-2 * (2 / 3) * (1.396 / 1.66e-3)
+_BIDEAU_MEHU_λ_MIN = 110 * u.nm
+
+# UV and IR resonance wavelengths of the [Babicz2020]_ parametrization.
+_CERN2020_λ_UV = 106.6 * u.nm
+_CERN2020_λ_IR = 908.3 * u.nm
+_CERN2020_λ_UV2_NM = _CERN2020_λ_UV.m_as(u.nm) ** 2
+_CERN2020_λ_IR2_NM = _CERN2020_λ_IR.m_as(u.nm) ** 2
+_CERN2020_λ_MIN = _CERN2020_λ_UV + 1 * u.nm
+_CERN2020_λ_MAX = _CERN2020_λ_IR - 1 * u.nm
+
+# constant part of the [Seidel2002]_ Rayleigh scattering formula, for λ in nm and the
+# resulting inverse length in 1/cm.
+_LAR_COMPRESSIBILITY = 2.18e-10 * u.cm**2 / (1.0e-5 * u.newton)  # isothermal
+_BOLTZMANN = 1.380658e-23 * u.joule / u.kelvin
+_RAYLEIGH_PREFACTOR = (2 / 3 * math.pi) ** 3 * (_LAR_COMPRESSIBILITY * _BOLTZMANN).m_as(
+    u.nm**4 / u.cm / u.K
+)
+_RAYLEIGH_INV_L_MIN = (1 / (10.0 * u.km)).m_as(1 / u.cm)
+_RAYLEIGH_INV_L_MAX = (1 / (0.1 * u.nm)).m_as(1 / u.cm)
+
 
 class ArScintLiftime(NamedTuple):
     singlet: Quantity
@@ -57,6 +88,7 @@ class ArScintLiftime(NamedTuple):
         return (self.singlet, self.triplet)
 
 
+@u.wraps("dimensionless", "nm", strict=True)
 def lar_dielectric_constant_bideau_mehu(
     λ: Quantity,
 ) -> Quantity:
@@ -67,27 +99,24 @@ def lar_dielectric_constant_bideau_mehu(
 
     .. optics-plot:: {'call_x': True}
     """
-    if not λ.check("[length]"):
-        msg = "input does not look like a wavelength"
-        raise ValueError(msg)
-
-    if np.any(λ < 110 * u.nm):
-        msg = f"this parametrization is not meaningful below {110*u.nm}"
+    if np.any(λ < _BIDEAU_MEHU_λ_MIN.m):
+        msg = f"this parametrization is not meaningful below {_BIDEAU_MEHU_λ_MIN}"
         raise ValueError(msg)
 
-    # equation for n-1
-    ϵ = 1.2055e-2 * (
-        0.2075 * λ**2 / (91.012 * λ**2 - 1 * u.um**2)
-        + 0.0415 * λ**2 / (87.892 * λ**2 - 1 * u.um**2)
-        + 4.3330 * λ**2 / (214.02 * λ**2 - 1 * u.um**2)
+    # equation for n-1, evaluated on the bare magnitudes (λ in µm).
+    λ2 = (λ * 1e-3) ** 2
+    a, b = _BIDEAU_MEHU_A, _BIDEAU_MEHU_B
+    ϵ = _BIDEAU_MEHU_SCALE * (
+        a[0] * λ2 / (b[0] * λ2 - 1)
+        + a[1] * λ2 / (b[1] * λ2 - 1)
+        + a[2] * λ2 / (b[2] * λ2 - 1)
     )
-    ϵ *= 2 / 3  # Bideau-Sellmeier -> Clausius-Mossotti
-    ϵ *= 1.396 / 1.66e-3  # density correction (Ar gas -> LAr liquid)
 
     # solve Clausius-Mossotti
     return (1 + 2 * ϵ) / (1 - ϵ)
 
 
+@u.wraps("dimensionless", "nm", strict=True)
 def lar_dielectric_constant_cern2020(
     λ: Quantity,
 ) -> Quantity:
@@ -97,21 +126,47 @@ def lar_dielectric_constant_cern2020(
 
     .. optics-plot:: {'call_x': True}
     """
-    if not λ.check("[length]"):
-        msg = "input does not look like a wavelength"
+    if np.any((λ < _CERN2020_λ_MIN.m) | (λ > _CERN2020_λ_MAX.m)):
+        msg = f"this parametrization holds only between {_CERN2020_λ_MIN} and {_CERN2020_λ_MAX}"
         raise ValueError(msg)
 
-    λ_uv = 106.6 * u.nm
-    λ_ir = 908.3 * u.nm
+    # evaluate on the bare magnitudes (λ in nm).
+    λ2 = λ**2
+    λ_uv2, λ_ir2 = _CERN2020_λ_UV2_NM, _CERN2020_λ_IR2_NM
+    x = 0.334 + ((0.100 * λ2) / (λ2 - λ_uv2) + (0.008 * λ2) / (λ2 - λ_ir2))
+
+    # solve Clausius-Mossotti
+    return (3 + 2 * x) / (3 - x)
+
+
+_LAR_DIELECTRIC_METHODS = {
+    "bideau-mehu": lar_dielectric_constant_bideau_mehu,
+    "cern2020": lar_dielectric_constant_cern2020,
+}
 
-    if np.any(λ < λ_uv + 1 * u.nm) or np.any(λ > λ_ir - 1 * u.nm):
-        msg = f"this parametrization holds only between {λ_uv+1*u.nm} and {λ_ir-1*u.nm}"
+
+def _lar_dielectric_constant(λ: Quantity, method: ArDielectricMethods) -> Quantity:
+    fn = _LAR_DIELECTRIC_METHODS.get(method)
+    if fn is None:
+        msg = f"Unknown LAr dielectric constant method {method}"
         raise ValueError(msg)
+    return fn(λ)
 
-    x = 0.334 + ((0.100 * λ**2) / (λ**2 - λ_uv**2) + (0.008 * λ**2) / (λ**2 - λ_ir**2))
 
-    # solve Clausius-Mossotti
-    return (3 + 2 * x) / (3 - x)
+@functools.lru_cache(maxsize=32)
+def _lar_dielectric_constant_cached(
+    method: ArDielectricMethods,
+    unit: pint.Unit,
+    shape: tuple[int, ...],
+    dtype: str,
+    λ_bytes: bytes,
+) -> tuple[float | np.ndarray, pint.Unit]:
+    λ = u.Quantity(np.frombuffer(λ_bytes, dtype=dtype).reshape(shape), unit)
+    ϵ = _lar_dielectric_constant(λ, method)
+    if isinstance(ϵ.m, np.ndarray):
+        ϵ.m.flags.writeable = False
+    # only cache the bare magnitude, as Quantity objects can be modified in place.
+    return ϵ.m, ϵ.u
 
 
 @store.register_pluggable
@@ -120,16 +175,21 @@ def lar_dielectric_constant(
 ) -> Quantity:
     """Calculate the dielectric constant of LAr for a given photon wavelength.
 
+    The results are cached, as the same wavelength grid is usually evaluated multiple
+    times.
+
     See Also
     --------
     .lar_dielectric_constant_bideau_mehu .lar_dielectric_constant_cern2020
     """
-    if method == "bideau-mehu":
-        return lar_dielectric_constant_bideau_mehu(λ)
-    if method == "cern2020":
-        return lar_dielectric_constant_cern2020(λ)
-    msg = f"Unknown LAr dielectric constant method {method}"
-    raise ValueError(msg)
+    if not isinstance(λ, Quantity):
+        return _lar_dielectric_constant(λ, method)
+
+    λ_m = np.asarray(λ.m)
+    ϵ, unit = _lar_dielectric_constant_cached(
+        method, λ.u, λ_m.shape, λ_m.dtype.str, λ_m.tobytes()
+    )
+    return u.Quantity(ϵ, unit)
 
 
 @store.register_pluggable
@@ -145,15 +205,12 @@ def lar_refractive_index(
 
     .. optics-plot:: {'call_x': True}
     """
-    return np.sqrt(lar_dielectric_constant(λ, method))
+    ϵ = lar_dielectric_constant(λ, method)
+    return u.Quantity(np.sqrt(ϵ.m_as(u.dimensionless)), u.dimensionless)
 
 
-@store.register_pluggable
-def lar_emission_spectrum(λ: Quantity) -> Quantity:
-    """Return the LAr emission spectrum, adapted from [Heindl2010]_.
-
-    .. optics-plot:: {'call_x': True, 'xlim': [116, 141]}
-    """
+@functools.cache
+def _heindl_emission_graph() -> InterpolatingGraph:
     heindl = readdatafile("lar_emission_heindl2010.dat")
 
     # sample the measured emission spectrum and avoid the fluctuations below 115 nm.
@@ -161,7 +218,16 @@ def lar_emission_spectrum(λ: Quantity) -> Quantity:
         *heindl,
         min_idx=115 * u.nm,
         max_idx=150 * u.nm,
-    )(λ)
+    )
+
+
+@store.register_pluggable
+def lar_emission_spectrum(λ: Quantity) -> Quantity:
+    """Return the LAr emission spectrum, adapted from [Heindl2010]_.
+
+    .. optics-plot:: {'call_x': True, 'xlim': [116, 141]}
+    """
+    return _heindl_emission_graph()(λ)
 
 
 @store.register_pluggable
@@ -177,6 +243,7 @@ def lar_fano_factor() -> float:
 
 
 @store.register_pluggable
+@u.wraps("cm", ("nm", "K", None), strict=True)
 def lar_rayleigh(
     λ: Quantity,
     temperature: Quantity = 90 * u.K,
@@ -195,26 +262,18 @@ def lar_rayleigh(
 
     .. optics-plot:: {'call_x': True}
     """
-    if not temperature.check("[temperature]"):
-        msg = "input does not look like a temperature"
-        raise ValueError(msg)
-
-    dyne = 1.0e-5 * u.newton
-    κ = 2.18e-10 * u.cm**2 / dyne  # LAr isothermal compressibility
-    k = 1.380658e-23 * u.joule / u.kelvin  # the Boltzmann constant
-
-    ϵ = lar_dielectric_constant(λ, method)
-    assert not np.any(ϵ < 1.00000001)
+    # λ (in nm) and the temperature (in K) enter as bare magnitudes, the result is in cm.
+    ϵ = lar_dielectric_constant(u.Quantity(λ, u.nm), method).m_as(u.dimensionless)
+    assert np.all(ϵ >= 1.00000001)
 
     inv_l = ((ϵ - 1.0) * (ϵ + 2.0)) ** 2
-    inv_l *= κ * temperature * k
+    inv_l *= _RAYLEIGH_PREFACTOR * temperature
     inv_l /= λ**4
-    inv_l *= (2 / 3 * np.pi) ** 3
 
-    assert not np.any(inv_l < 1 / (10.0 * u.km))
-    assert not np.any(inv_l > 1 / (0.1 * u.nm))
+    assert np.all(inv_l >= _RAYLEIGH_INV_L_MIN)
+    assert np.all(inv_l <= _RAYLEIGH_INV_L_MAX)
 
-    return (1 / inv_l).to("cm")  # simplify units
+    return 1 / inv_l
 
 
 @store.register_pluggable
@@ -229,9 +288,9 @@ def lar_abs_length(λ: Quantity) -> Quantity:
 
     .. optics-plot:: {'call_x': True}
     """
-    λ = np.maximum(λ, 141 * u.nm)
-    absl = 5.976e-12 * np.exp(0.223 * λ.to("nm").m) * u.cm
-    return np.minimum(absl, 100000 * u.cm)  # avoid large numbers
+    λ_nm = np.maximum(λ.m_as(u.nm), 141)
+    absl = 5.976e-12 * np.exp(0.223 * λ_nm)
+    return u.Quantity(np.minimum(absl, 100000), u.cm)  # avoid large numbers
 
 
 @store.register_pluggable
@@ -248,7 +307,7 @@ def lar_peak_attenuation_length(
         msg = f"unknown attenuation_method {attenuation_method}"
         raise ValueError(msg)
 
-    assert attenuation_method.check("[length]")
+    assert attenuation_method.dimensionality == _LENGTH_DIM
     return attenuation_method
 
 
@@ -333,16 +392,20 @@ def lar_calculate_attenuation(
     rayleigh = lar_rayleigh(λ_full, lar_temperature, lar_dielectric_method)
     peak_rayleigh_length = lar_rayleigh(126.8 * u.nm, lar_temperature)
     if isinstance(rayleigh_enabled_or_length, Quantity):
-        assert rayleigh_enabled_or_length.check("[length]")
+        assert rayleigh_enabled_or_length.dimensionality == _LENGTH_DIM
         rayleigh *= rayleigh_enabled_or_length / peak_rayleigh_length
         peak_rayleigh_length = rayleigh_enabled_or_length
 
     peak_att_length = lar_peak_attenuation_length(attenuation_method_or_length)
     # absorption length and rayleigh add up inversely to the measured attenuation length.
-    peak_abs_length = 1 / (1 / peak_att_length - 1 / peak_rayleigh_length)
+    # (evaluated on the bare magnitudes in cm, to avoid creating intermediate quantities.)
+    peak_abs_length = u.Quantity(
+        1 / (1 / peak_att_length.m_as(u.cm) - 1 / peak_rayleigh_length.m_as(u.cm)),
+        u.cm,
+    )
 
     if isinstance(absorption_enabled_or_length, Quantity):
-        assert absorption_enabled_or_length.check("[length]")
+        assert absorption_enabled_or_length.dimensionality == _LENGTH_DIM
         peak_abs_length = absorption_enabled_or_length
 
     # absorption length is _not_ correctly scaled yet.
@@ -451,12 +514,11 @@ def pyg4_lar_attach_rindex(
     .lar_refractive_index
     .lar_dielectric_constant
     """
-    from legendoptics.pyg4utils import pyg4_sample_λ
+    from legendoptics.pyg4utils import _pyg4_sample_λ_e
 
-    λ_full = pyg4_sample_λ(112 * u.nm, 650 * u.nm)
+    λ_full, e_full = _pyg4_sample_λ_e(112 * u.nm, 650 * u.nm)
     rindex = lar_refractive_index(λ_full, lar_dielectric_method)
-    with u.context("sp"):
-        lar_mat.addVecPropertyPint("RINDEX", λ_full.to("eV"), rindex)
+    lar_mat.addVecPropertyPint("RINDEX", e_full, rindex)
 
 
 @store.register_pluggable
@@ -511,7 +573,9 @@ def pyg4_lar_attach_attenuation(
     .lar_abs_length
     .lar_calculate_attenuation
     """
-    peak_rayleigh_length, peak_abs_length, λ_full, rayleigh, abslength, _attenuation = (
+    from legendoptics.pyg4utils import _pyg4_sample_λ_e
+
+    peak_rayleigh_length, peak_abs_length, _, rayleigh, abslength, _attenuation = (
         lar_calculate_attenuation(
             lar_temperature,
             lar_dielectric_method,
@@ -521,11 +585,12 @@ def pyg4_lar_attach_attenuation(
         )
     )
 
-    with u.context("sp"):
-        if rayleigh is not None:
-            lar_mat.addVecPropertyPint("RAYLEIGH", λ_full.to("eV"), rayleigh)
-        if abslength is not None:
-            lar_mat.addVecPropertyPint("ABSLENGTH", λ_full.to("eV"), abslength)
+    # the energies of the same grid as sampled in lar_calculate_attenuation.
+    _, e_full = _pyg4_sample_λ_e(112 * u.nm, 650 * u.nm)
+    if rayleigh is not None:
+        lar_mat.addVecPropertyPint("RAYLEIGH", e_full, rayleigh)
+    if abslength is not None:
+        lar_mat.addVecPropertyPint("ABSLENGTH", e_full, abslength)
 
     return peak_rayleigh_length, peak_abs_length
 
@@ -553,21 +618,17 @@ def pyg4_lar_attach_scintillation(
     .lar_emission_spectrum
     .lar_lifetimes
     """
-    from legendoptics.pyg4utils import pyg4_def_scint_by_particle_type, pyg4_sample_λ
-
-    λ_peak = pyg4_sample_λ(116 * u.nm, 141 * u.nm)
+    from legendoptics.pyg4utils import (
+        _pyg4_sample_emission,
+        pyg4_def_scint_by_particle_type,
+    )
 
-    # sample the measured emission spectrum.
-    scint_em = lar_emission_spectrum(λ_peak)
-    # make sure that the scintillation spectrum is zero at the boundaries.
-    scint_em[0] = 0
-    scint_em[-1] = 0
+    _, e_peak, scint_em = _pyg4_sample_emission(
+        lar_emission_spectrum, 116 * u.nm, 141 * u.nm
+    )
 
-    with u.context("sp"):
-        lar_scint = lar_mat.addVecPropertyPint(
-            "SCINTILLATIONCOMPONENT1", λ_peak.to("eV"), scint_em
-        )
-        lar_mat.addProperty("SCINTILLATIONCOMPONENT2", lar_scint)
+    lar_scint = lar_mat.addVecPropertyPint("SCINTILLATIONCOMPONENT1", e_peak, scint_em)
+    lar_mat.addProperty("SCINTILLATIONCOMPONENT2", lar_scint)
 
     lifetimes = lar_lifetimes(triplet_lifetime_method)
     lar_mat.addConstPropertyPint("SCINTILLATIONTIMECONSTANT1", lifetimes.singlet)
@@ -591,15 +652,11 @@ def g4gps_lar_emissions_spectrum(filename: str, output_macro: bool) -> None:
     .lar_emission_spectrum
     utils.g4gps_write_emission_spectrum
     """
-    from legendoptics.pyg4utils import pyg4_sample_λ
+    from legendoptics.pyg4utils import _pyg4_sample_emission
 
-    λ_peak = pyg4_sample_λ(116 * u.nm, 141 * u.nm)
-
-    # sample the measured emission spectrum.
-    scint_em = lar_emission_spectrum(λ_peak)
-    # make sure that the scintillation spectrum is zero at the boundaries.
-    scint_em[0] = 0
-    scint_em[-1] = 0
+    λ_peak, _, scint_em = _pyg4_sample_emission(
+        lar_emission_spectrum, 116 * u.nm, 141 * u.nm
+    )
 
     g4gps_write_emission_spectrum(
         filename, output_macro, λ_peak, scint_em, "lar_emissions_spectrum"
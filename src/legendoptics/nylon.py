@@ -51,10 +51,10 @@ def pyg4_nylon_attach_rindex(mat, reg) -> None:
     --------
     .nylon_refractive_index
     """
-    λ = np.array([650.0, 115.0]) * u.nm
-    r = [nylon_refractive_index()] * 2
-    with u.context("sp"):
-        mat.addVecPropertyPint("RINDEX", λ.to("eV"), r)
+    from legendoptics.pyg4utils import _RINDEX_E
+
+    r = np.full(_RINDEX_E.shape, nylon_refractive_index())
+    mat.addVecPropertyPint("RINDEX", _RINDEX_E, r)
 
 
 def pyg4_nylon_attach_absorption(mat, reg) -> None:
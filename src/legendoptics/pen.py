@@ -10,7 +10,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+from typing import Callable
 
 import numpy as np
 import pint
@@ -93,6 +95,7 @@ def pen_absorption() -> tuple[Quantity, Quantity]:
 
 
 @store.register_pluggable
+@functools.cache
 def pen_wls_absorption() -> tuple[Quantity, Quantity]:
     """WLS absorption of PEN.
 
@@ -108,6 +111,8 @@ def pen_wls_absorption() -> tuple[Quantity, Quantity]:
     wvl = np.array([70, 71, 380, 381]) * u.nm
     absorp = np.array([1e3, 2e-8, 2e-8, 1e3]) * u.m  # 1e3 is "infinity"
     assert absorp.check("[length]")
+    wvl.m.flags.writeable = False
+    absorp.m.flags.writeable = False
     return wvl, absorp
 
 
@@ -129,6 +134,17 @@ def pen_scintillation_params() -> ScintConfig:
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _pen_wls_emission_graph_of(impl: Callable) -> InterpolatingGraph:
+    return InterpolatingGraph(*impl(), min_idx=350 * u.nm)
+
+
+def _pen_wls_emission_graph() -> InterpolatingGraph:
+    # the graph is keyed on the current implementation, so that a replaced
+    # pen_wls_emission is respected.
+    return _pen_wls_emission_graph_of(pen_wls_emission.current_impl())
+
+
 def pyg4_pen_attach_rindex(mat, reg) -> None:
     """Attach the refractive index to the given PEN material instance.
 
@@ -136,10 +152,23 @@ def pyg4_pen_attach_rindex(mat, reg) -> None:
     --------
     .pen_refractive_index
     """
-    λ = np.array([650.0, 115.0]) * u.nm
-    r = [pen_refractive_index()] * 2
-    with u.context("sp"):
-        mat.addVecPropertyPint("RINDEX", λ.to("eV"), r)
+    from legendoptics.pyg4utils import _RINDEX_E
+
+    r = np.full(_RINDEX_E.shape, pen_refractive_index())
+    mat.addVecPropertyPint("RINDEX", _RINDEX_E, r)
+
+
+@functools.lru_cache(maxsize=8)
+@u.with_context("sp")
+def _pen_g4_absorption_of(impl: Callable) -> tuple[Quantity, Quantity]:
+    λ_abs, absorption = impl()
+    absorption = absorption.copy()
+    # set absorption for lowest wavelength to "infinity".
+    absorption[np.argmin(λ_abs)] = 1e3 * u.m
+    e_abs = λ_abs.to("eV")
+    e_abs.m.flags.writeable = False
+    absorption.m.flags.writeable = False
+    return e_abs, absorption
 
 
 def pyg4_pen_attach_attenuation(mat, reg) -> None:
@@ -149,11 +178,9 @@ def pyg4_pen_attach_attenuation(mat, reg) -> None:
     --------
     .pen_absorption
     """
-    with u.context("sp"):
-        λ_abs, absorption = pen_absorption()
-        # set absorption for lowest wavelength to "infinity".
-        absorption[np.argmin(λ_abs)] = 1e3 * u.m
-        mat.addVecPropertyPint("ABSLENGTH", λ_abs.to("eV"), absorption)
+    # as for the emission graph, the vectors are keyed on the current implementation.
+    e_abs, absorption = _pen_g4_absorption_of(pen_absorption.current_impl())
+    mat.addVecPropertyPint("ABSLENGTH", e_abs, absorption)
 
 
 def pyg4_pen_attach_wls(mat, reg, quantum_efficiency: bool | float = True) -> None:
@@ -173,19 +200,20 @@ def pyg4_pen_attach_wls(mat, reg, quantum_efficiency: bool | float = True) -> No
     .pen_scint_timeconstant
     .pen_quantum_efficiency
     """
-    from legendoptics.pyg4utils import pyg4_sample_λ
+    from legendoptics.pyg4utils import _pyg4_sample_λ_e
 
     λ_abs, absorption = pen_wls_absorption()
 
-    λ_scint = pyg4_sample_λ(350 * u.nm, 650 * u.nm, 800)  # sample more points for WLS.
-    emission = InterpolatingGraph(*pen_wls_emission(), min_idx=350 * u.nm)(λ_scint)
+    # sample more points for WLS.
+    λ_scint, e_scint = _pyg4_sample_λ_e(350 * u.nm, 650 * u.nm, 800)
+    emission = _pen_wls_emission_graph()(λ_scint)
     # make sure that the scintillation spectrum is zero at the boundaries.
     emission[0] = 0
     emission[-1] = 0
 
     with u.context("sp"):
         mat.addVecPropertyPint("WLSABSLENGTH", λ_abs.to("eV"), absorption)
-        mat.addVecPropertyPint("WLSCOMPONENT", λ_scint.to("eV"), emission)
+        mat.addVecPropertyPint("WLSCOMPONENT", e_scint, emission)
 
     mat.addConstPropertyPint("WLSTIMECONSTANT", pen_scint_timeconstant())
     if quantum_efficiency is True:
@@ -205,17 +233,15 @@ def pyg4_pen_attach_scintillation(mat, reg) -> None:
     .pen_wls_emission
     .pen_scint_timeconstant
     """
-    from legendoptics.pyg4utils import pyg4_def_scint_by_particle_type, pyg4_sample_λ
-
-    # sample the measured emission spectrum.
-    λ_scint = pyg4_sample_λ(350 * u.nm, 650 * u.nm, 200)
-    scint_em = InterpolatingGraph(*pen_wls_emission(), min_idx=350 * u.nm)(λ_scint)
-    # make sure that the scintillation spectrum is zero at the boundaries.
-    scint_em[0] = 0
-    scint_em[-1] = 0
+    from legendoptics.pyg4utils import (
+        _pyg4_sample_emission,
+        pyg4_def_scint_by_particle_type,
+    )
 
-    with u.context("sp"):
-        mat.addVecPropertyPint("SCINTILLATIONCOMPONENT1", λ_scint.to("eV"), scint_em)
+    _, e_scint, scint_em = _pyg4_sample_emission(
+        _pen_wls_emission_graph(), 350 * u.nm, 650 * u.nm
+    )
+    mat.addVecPropertyPint("SCINTILLATIONCOMPONENT1", e_scint, scint_em)
 
     mat.addConstPropertyPint("SCINTILLATIONTIMECONSTANT1", pen_scint_timeconstant())
 
@@ -234,14 +260,11 @@ def g4gps_pen_emissions_spectrum(filename: str, output_macro: bool) -> None:
     .pen_wls_emission
     utils.g4gps_write_emission_spectrum
     """
-    from legendoptics.pyg4utils import pyg4_sample_λ
+    from legendoptics.pyg4utils import _pyg4_sample_emission
 
-    # sample the measured emission spectrum.
-    λ_scint = pyg4_sample_λ(350 * u.nm, 650 * u.nm, 200)
-    scint_em = InterpolatingGraph(*pen_wls_emission(), min_idx=350 * u.nm)(λ_scint)
-    # make sure that the scintillation spectrum is zero at the boundaries.
-    scint_em[0] = 0
-    scint_em[-1] = 0
+    λ_scint, _, scint_em = _pyg4_sample_emission(
+        _pen_wls_emission_graph(), 350 * u.nm, 650 * u.nm
+    )
 
     g4gps_write_emission_spectrum(
         filename, output_macro, λ_scint, scint_em, "pen_emissions_spectrum"
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
-from typing import Callable
+import functools
+from typing import TYPE_CHECKING, Callable
 
-import matplotlib.pyplot as plt
 import pint
 from pint import Quantity
 
-pint.get_application_registry().setup_matplotlib(True)
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
 
 
-def plot_continuous_prop(ax: plt.Axes, prop: Callable, x: Quantity, param_dict=None):
+@functools.cache
+def _setup_matplotlib() -> None:
+    # importing matplotlib is slow, so only do it when actually plotting.
+    pint.get_application_registry().setup_matplotlib(True)
+
+
+def plot_continuous_prop(ax: Axes, prop: Callable, x: Quantity, param_dict=None):
     """Plot continuous property.
 
     Plots the `prop` function on values `x` with matplotlib's :func:`plot`.
+    The figure layout is left to the caller (e.g. a single
+    :meth:`~matplotlib.figure.Figure.tight_layout` call after plotting).
 
     Parameters
     ----------
@@ -27,19 +36,18 @@ def plot_continuous_prop(ax: plt.Axes, prop: Callable, x: Quantity, param_dict=N
         dictionary defining custom matplotlib settings to be passed to
         :func:`plot`.
     """
+    _setup_matplotlib()
     if param_dict is None:
         param_dict = {}
     ax.grid(True)
-    out = ax.plot(x, prop(x), **param_dict)
-    plt.tight_layout()
-    return out
+    return ax.plot(x, prop(x), **param_dict)
 
 
-def plot_discrete_prop(ax: plt.Axes, prop: Callable, param_dict=None):
+def plot_discrete_prop(ax: Axes, prop: Callable, param_dict=None):
     """Plot discrete property.
 
     Unpacks what returned by the `prop` function and feeds it to matplotlib's
-    :func:`plot`.
+    :func:`plot`. The figure layout is left to the caller.
 
     Parameters
     ----------
@@ -52,9 +60,8 @@ def plot_discrete_prop(ax: plt.Axes, prop: Callable, param_dict=None):
         dictionary defining custom matplotlib settings to be passed to
         :func:`plot`.
     """
+    _setup_matplotlib()
     if param_dict is None:
         param_dict = {}
     ax.grid(True)
-    out = ax.plot(*prop(), marker="o", **param_dict)
-    plt.tight_layout()
-    return out
+    return ax.plot(*prop(), marker="o", **param_dict)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import logging
+from typing import Callable
 
 import numpy as np
 import pint
@@ -13,16 +15,71 @@ from .scintillate import ScintConfig
 log = logging.getLogger(__name__)
 ureg = pint.get_application_registry().get()
 
+# energies of the two points used to attach constant refractive indices.
+with ureg.context("sp"):
+    _RINDEX_E = (np.array([650.0, 115.0]) * ureg.nm).to("eV")
+_RINDEX_E.m.flags.writeable = False
+
+
+@functools.lru_cache(maxsize=32)
+@ureg.with_context("sp")
+def _pyg4_sample_λ_nm(
+    start_nm: float, end_nm: float, sample_count: int
+) -> tuple[Quantity, Quantity]:
+    start_lambda = ureg.Quantity(start_nm, ureg.nm)
+    end_lambda = ureg.Quantity(end_nm, ureg.nm)
+    samples_e = np.linspace(
+        end_lambda.to("eV"), start_lambda.to("eV"), num=sample_count
+    )
+    samples = samples_e.to("nm")
+    samples.m.flags.writeable = False
+    samples_e.m.flags.writeable = False
+    return samples, samples_e
+
 
 @ureg.with_context("sp")
+def _pyg4_sample_λ_e(
+    start_lambda: Quantity, end_lambda: Quantity, sample_count: int = 200
+) -> tuple[Quantity, Quantity]:
+    """Sampled wavelengths (as :func:`pyg4_sample_λ`) and their corresponding energies.
+
+    The grids are cached, as the same few grids are sampled for each material. The
+    returned arrays are shared and read-only.
+    """
+    assert start_lambda <= end_lambda
+    return _pyg4_sample_λ_nm(
+        float(start_lambda.m_as("nm")), float(end_lambda.m_as("nm")), sample_count
+    )
+
+
 def pyg4_sample_λ(
     start_lambda: Quantity, end_lambda: Quantity, sample_count: int = 200
 ) -> Quantity:
     """Sample equally-spaced energies between the two specified wavelengths."""
-    assert start_lambda <= end_lambda
+    return _pyg4_sample_λ_e(start_lambda, end_lambda, sample_count)[0].copy()
 
-    samples = np.linspace(end_lambda.to("eV"), start_lambda.to("eV"), num=sample_count)
-    return samples.to("nm")
+
+def _pyg4_sample_emission(
+    emission: Callable[[Quantity], Quantity],
+    start_lambda: Quantity,
+    end_lambda: Quantity,
+    sample_count: int = 200,
+) -> tuple[Quantity, Quantity, Quantity]:
+    """Sample an emission spectrum on the grid of :func:`_pyg4_sample_λ_e`.
+
+    The spectrum is evaluated on each call (and not cached), as the emission spectrum
+    functions might be replaced by the user.
+
+    Returns
+    -------
+    the sampled wavelengths, their energies and the spectrum at these points.
+    """
+    λ, e = _pyg4_sample_λ_e(start_lambda, end_lambda, sample_count)
+    em = emission(λ)
+    # make sure that the spectrum is zero at the boundaries.
+    em[0] = 0
+    em[-1] = 0
+    return λ, e, em
 
 
 def _get_scint_yield_vector(yield_per_mev: Quantity):
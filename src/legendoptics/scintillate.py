@@ -86,13 +86,22 @@ def precompute_scintillation_params(
         else:
             particles[v] = np.array([p.yield_factor, 1])
 
-    time_components = np.array([t.to(u.nanosecond).m for t in time_components])
+    time_components = np.array(
+        [t.to(u.nanosecond).m for t in time_components], dtype=np.float64
+    )
     fano = scint_config.fano_factor if scint_config.fano_factor is not None else 1
 
-    return scint_config.flat_top.to("1/keV").m, fano, time_components, particles
+    # use fixed scalar types, so that the numba functions below are only compiled for a
+    # single signature of the parameter tuple.
+    return (
+        float(scint_config.flat_top.to("1/keV").m),
+        float(fano),
+        time_components,
+        particles,
+    )
 
 
-@njit
+@njit(cache=True)
 def scintillate_local(
     params: ComputedScintParams,
     particle: ParticleIndex,
@@ -145,16 +154,18 @@ def scintillate_local(
     yields[-1] = num_photons - np.sum(yields[0:-1])  # to keep the sum constant.
 
     # now, calculate the timestamps of each generated photon.
-    times = np.log(rng.uniform(size=num_photons))
+    times = np.empty(num_photons)
     start = 0
     for num_phot, scint_t in zip(yields, time_components):
-        times[start : start + num_phot] *= -scint_t
+        times[start : start + num_phot] = rng.exponential(scint_t, size=num_phot)
         start += num_phot
 
     return times
 
 
-@njit
+# use IEEE division semantics, i.e. a particle at rest yields infinite time offsets
+# instead of raising an error.
+@njit(cache=True, error_model="numpy")
 def scintillate(
     params: ComputedScintParams,
     x0_m: np.ndarray,
@@ -204,15 +215,107 @@ def scintillate(
     else:
         λ = np.ones(shape=delta_t_scint.shape[0])
 
-    x = np.empty((delta_t_scint.shape[0], 4))
-    # spatial components along the line segment between x0 and x1.
-    x[:, 1] = x0_m[0] + λ * (x1_m[0] - x0_m[0])
-    x[:, 2] = x0_m[1] + λ * (x1_m[1] - x0_m[1])
-    x[:, 3] = x0_m[2] + λ * (x1_m[2] - x0_m[2])
+    dx = x1_m - x0_m
+    # step-constant parts of the time component.
+    seg_len = np.sqrt(dx[0] ** 2 + dx[1] ** 2 + dx[2] ** 2)
+    dv_half = (v1_mpns - v0_mpns) * 0.5
 
-    # time component along the velocity decrease between x0 and x1.
-    x[:, 0] = np.linalg.norm(x1_m - x0_m) / (v0_mpns + λ * (v1_mpns - v0_mpns) / 2)
-    # add the global time offset and the emission time offset.
-    x[:, 0] += t0_ns + delta_t_scint
+    x = np.empty((delta_t_scint.shape[0], 4))
+    for i in range(x.shape[0]):
+        # time component along the velocity decrease between x0 and x1, plus the global
+        # time offset and the emission time offset.
+        x[i, 0] = seg_len / (v0_mpns + λ[i] * dv_half) + t0_ns + delta_t_scint[i]
+        # spatial components along the line segment between x0 and x1.
+        x[i, 1] = x0_m[0] + λ[i] * dx[0]
+        x[i, 2] = x0_m[1] + λ[i] * dx[1]
+        x[i, 3] = x0_m[2] + λ[i] * dx[2]
 
     return x
+
+
+@njit(cache=True)
+def scintillate_batch(
+    params: ComputedScintParams,
+    x0_m: np.ndarray,
+    x1_m: np.ndarray,
+    v0_mpns: np.ndarray,
+    v1_mpns: np.ndarray,
+    t0_ns: np.ndarray,
+    particle: np.ndarray,
+    particle_charge: np.ndarray,
+    edep_keV: np.ndarray,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Generates scintillation photons for many steps at once, see :meth:`scintillate`.
+
+    All step parameters are arrays with one entry (or row, for the positions) per step.
+    Looping over the steps in compiled code avoids the call overhead of invoking
+    :meth:`scintillate` for each step separately.
+
+    Parameters
+    ----------
+    params
+        scintillation parameter tuple, as created by :meth:`precompute_scintillation_params`.
+    x0_m
+        array of shape ``(N, 3)`` with the pre step point positions (in units of meter).
+    x1_m
+        array of shape ``(N, 3)`` with the post step point positions (in units of meter).
+    v0_mpns
+        velocities of the particles before the steps (in units of meter per nanosecond).
+    v1_mpns
+        velocities of the particles after the steps (in units of meter per nanosecond).
+    t0_ns
+        global time offsets of the step starts in scintillator, in nanoseconds.
+    particle
+        module-internal particle indices, see :meth:`particle_to_index`.
+    particle_charge
+        charges of the particles, in units of the elementary charge.
+    edep_keV
+        energy depositions along the steps, in units of keV.
+
+    Returns
+    -------
+    tuple of the array of four-vectors of all steps (as returned by :meth:`scintillate`)
+    and an array of ``N + 1`` offsets; the photons of step ``i`` are in the rows
+    ``offsets[i]:offsets[i + 1]``.
+    """
+    num_steps = edep_keV.shape[0]
+    # numba does not check bounds, so make sure that all step arrays are complete.
+    if (
+        x0_m.shape[0] != num_steps
+        or x1_m.shape[0] != num_steps
+        or v0_mpns.shape[0] != num_steps
+        or v1_mpns.shape[0] != num_steps
+        or t0_ns.shape[0] != num_steps
+        or particle.shape[0] != num_steps
+        or particle_charge.shape[0] != num_steps
+    ):
+        msg = "all step arrays must have the same length"
+        raise ValueError(msg)
+    if x0_m.shape[1] != 3 or x1_m.shape[1] != 3:
+        msg = "step positions must be three-vectors"
+        raise ValueError(msg)
+
+    offsets = np.zeros(num_steps + 1, dtype=np.int64)
+    steps = []
+    for i in range(num_steps):
+        x = scintillate(
+            params,
+            x0_m[i],
+            x1_m[i],
+            v0_mpns[i],
+            v1_mpns[i],
+            t0_ns[i],
+            particle[i],
+            particle_charge[i],
+            edep_keV[i],
+            rng,
+        )
+        steps.append(x)
+        offsets[i + 1] = offsets[i] + x.shape[0]
+
+    out = np.empty((offsets[-1], 4))
+    for i in range(num_steps):
+        out[offsets[i] : offsets[i + 1]] = steps[i]
+
+    return out, offsets
@@ -8,7 +8,8 @@ properties.
 Users can then replace the original implementation by their own implementations using
 ``replace_implementation(new_impl: Callable)``, and also switch back to the original
 implementation using ``reset_implementation()`` on the decorated function object. The
-original implementation is always available as ``original_impl()``.
+original implementation is always available as ``original_impl()``, and the currently used
+one as ``current_impl()``.
 
 Apart from the decorator, this store provides functions to get and reset the status of
 all registered pluggable functions.
@@ -51,10 +52,15 @@ def register_pluggable(fn: Callable) -> Callable:
         """The original function implementation."""
         return self._orig_impl
 
+    def current_impl(self) -> Callable:
+        """The currently used function implementation."""
+        return self._impl
+
     wrap.reset_implementation = MethodType(reset_implementation, wrap)
     wrap.replace_implementation = MethodType(replace_implementation, wrap)
     wrap.is_original = MethodType(is_original, wrap)
     wrap.original_impl = MethodType(original_impl, wrap)
+    wrap.current_impl = MethodType(current_impl, wrap)
 
     # store the wrapper to use it in the functions of this module.
     _optical_property_store.append(wrap)
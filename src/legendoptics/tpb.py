@@ -108,10 +108,10 @@ def pyg4_tpb_attach_rindex(mat, reg) -> None:
     --------
     .tpb_refractive_index
     """
-    λ = np.array([650.0, 115.0]) * u.nm
-    r = [tpb_refractive_index()] * 2
-    with u.context("sp"):
-        mat.addVecPropertyPint("RINDEX", λ.to("eV"), r)
+    from legendoptics.pyg4utils import _RINDEX_E
+
+    r = np.full(_RINDEX_E.shape, tpb_refractive_index())
+    mat.addVecPropertyPint("RINDEX", _RINDEX_E, r)
 
 
 def pyg4_tpb_attach_wls(
@@ -139,7 +139,7 @@ def pyg4_tpb_attach_wls(
     .tpb_wls_timeconstant
     .tpb_quantum_efficiency
     """
-    from legendoptics.pyg4utils import pyg4_sample_λ
+    from legendoptics.pyg4utils import _pyg4_sample_λ_e
 
     if emission_spectrum not in ["default", "polystyrene_matrix"]:
         msg = "invalid parameter value of emission_spectrum"
@@ -149,7 +149,7 @@ def pyg4_tpb_attach_wls(
     if emission_spectrum == "polystyrene_matrix":
         emission_fn = tpb_polystyrene_wls_emission
 
-    λ_full = pyg4_sample_λ(112 * u.nm, 650 * u.nm, 800)
+    λ_full, e_full = _pyg4_sample_λ_e(112 * u.nm, 650 * u.nm, 800)
 
     absorption = InterpolatingGraph(*tpb_wls_absorption())(λ_full)
     emission = InterpolatingGraph(*emission_fn())(λ_full)
@@ -157,9 +157,8 @@ def pyg4_tpb_attach_wls(
     emission[0] = 0
     emission[-1] = 0
 
-    with u.context("sp"):
-        mat.addVecPropertyPint("WLSABSLENGTH", λ_full.to("eV"), absorption)
-        mat.addVecPropertyPint("WLSCOMPONENT", λ_full.to("eV"), emission)
+    mat.addVecPropertyPint("WLSABSLENGTH", e_full, absorption)
+    mat.addVecPropertyPint("WLSCOMPONENT", e_full, emission)
 
     mat.addConstPropertyPint("WLSTIMECONSTANT", tpb_wls_timeconstant())
     if quantum_efficiency is True:
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
+import functools
 import logging
 from pathlib import Path
 
 import numpy as np
 import pint
-import scipy.interpolate
 from importlib_resources import files
 from pint import Quantity
 
@@ -13,6 +13,7 @@ log = logging.getLogger(__name__)
 u = pint.get_application_registry()
 
 
+@functools.cache
 def readdatafile(filename: str) -> tuple[Quantity, Quantity]:
     """Read ``(x, y)`` data points from `filename` with units.
 
@@ -26,35 +27,36 @@ def readdatafile(filename: str) -> tuple[Quantity, Quantity]:
     After the first line, comments are also allowed after a ``#`` character.
 
     Units in the header must be parseable as :mod:`pint` units.
+
+    The parsed data is cached per file, and the returned arrays are shared between all
+    callers. They are marked read-only, so callers have to :meth:`~numpy.ndarray.copy`
+    them before modifying them in place. The same holds for the property functions
+    returning cached data.
     """
-    x = []
-    y = []
-    lines = files("legendoptics.data").joinpath(filename).read_text().split("\n")
-    lines = [line.strip() for line in lines]
-
-    # parse header
-    header = lines[0]
-    if header[0] != "#" or len(header.lstrip("#").split()) != 2:
-        msg = "input data file does not seem to contain header with (pint) units"
-        raise RuntimeError(msg)
+    with files("legendoptics.data").joinpath(filename).open("rb") as f:
+        # parse header
+        header = f.readline().decode().strip()
+        if not header.startswith("#") or len(header.lstrip("#").split()) != 2:
+            msg = "input data file does not seem to contain header with (pint) units"
+            raise RuntimeError(msg)
 
-    units = header.lstrip("#").split()
+        units = header.lstrip("#").split()
 
-    lineno = 0
-    for line in lines[1:-1]:
-        lineno += 1
-        if not line or line[0] == "#":  # skip empty lines and lines with comments.
-            continue
+        try:
+            data = np.loadtxt(f, comments="#", dtype=np.float64, ndmin=2)
+        except ValueError as e:
+            msg = f"could not parse data file {filename}: {e}"
+            raise RuntimeError(msg) from e
 
-        val = line.split()
-        if len(val) != 2:
-            msg = f"could not parse line {lineno}: '{line}'"
-            raise RuntimeError(msg)
-
-        x.append(float(val[0]))
-        y.append(float(val[1]))
+    if data.shape[1] != 2:
+        msg = f"could not parse data file {filename}: expected two columns"
+        raise RuntimeError(msg)
 
-    return (x * u(units[0]), y * u(units[1]))
+    x = data[:, 0] * u(units[0])
+    y = data[:, 1] * u(units[1])
+    x.m.flags.writeable = False
+    y.m.flags.writeable = False
+    return (x, y)
 
 
 class InterpolatingGraph:
@@ -81,34 +83,20 @@ class InterpolatingGraph:
 
         self.idx = idx
         self.vals = vals
-        self.d_min = min(idx)
-        self.d_max = max(idx)
         self.n = len(idx)
-        assert min(vals).m >= 0  # We only want positive values in the spectra
-        self.fn = scipy.interpolate.interp1d(idx.m, vals.m)
+        assert vals.m.min() >= 0  # We only want positive values in the spectra
+
+        # np.interp requires increasing x values, and clamps to the first/last value
+        # outside of the defined range.
+        sort = np.argsort(idx.m, kind="stable")
+        self._x = idx.m[sort]
+        self._y = vals.m[sort]
+        self.d_min = Quantity(self._x[0], idx.u)
+        self.d_max = Quantity(self._x[-1], idx.u)
 
     def __call__(self, pts: Quantity) -> Quantity:
         # return first/last value if pts out of defined range
-        if isinstance(pts.m, np.ndarray):
-            p = pts.to(self.idx.u).m
-            return Quantity(
-                np.piecewise(
-                    p,
-                    [
-                        p < self.d_min.m,
-                        ((p >= self.d_min.m) & (p <= self.d_max.m)),
-                        p > self.d_max.m,
-                    ],
-                    [self.vals[0].m, self.fn, self.vals[-1].m],
-                ),
-                self.vals.u,
-            )
-
-        if pts < self.d_min:
-            return self.vals.iloc[0]
-        if pts > self.d_max:
-            return self.vals.iloc[-1]
-        return self.fn(pts.to(self.idx.u).m) * self.vals.u
+        return Quantity(np.interp(pts.m_as(self.idx.u), self._x, self._y), self.vals.u)
 
 
 def g4gps_write_emission_spectrum(
@@ -5,3 +5,12 @@ from legendoptics.utils import readdatafile
 
 def test_read_data_file():
     readdatafile("lar_emission_heindl2010.dat")
+
+
+def test_read_data_file_cached():
+    x, y = readdatafile("lar_emission_heindl2010.dat")
+    assert readdatafile("lar_emission_heindl2010.dat") is readdatafile(
+        "lar_emission_heindl2010.dat"
+    )
+    assert not x.m.flags.writeable
+    assert not y.m.flags.writeable
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import numpy as np
+import pint
+import pytest
+
+from legendoptics.utils import InterpolatingGraph
+
+u = pint.get_application_registry()
+
+
+def test_interpolating_graph_unsorted():
+    idx = np.array([1, 2, 3, 4, 5], dtype=np.float64) * u.nm
+    vals = np.array([10, 20, 40, 30, 0], dtype=np.float64) * u.m
+    perm = np.array([3, 0, 4, 2, 1])
+
+    g_sorted = InterpolatingGraph(idx, vals)
+    g_unsorted = InterpolatingGraph(idx[perm], vals[perm])
+
+    pts = np.linspace(0, 6, 25) * u.nm
+    assert np.array_equal(g_sorted(pts).m, g_unsorted(pts).m)
+    assert g_unsorted(pts).u == u.m
+    assert g_unsorted.d_min == 1 * u.nm
+    assert g_unsorted.d_max == 5 * u.nm
+    # between the data points, the values are interpolated linearly.
+    assert g_unsorted(2.5 * u.nm).m == pytest.approx(30)
+    assert g_unsorted(3.25 * u.nm).m == pytest.approx(37.5)
+
+
+def test_interpolating_graph_scalar():
+    idx = np.array([1, 2, 3], dtype=np.float64) * u.nm
+    vals = np.array([10, 20, 40], dtype=np.float64) * u.m
+    g = InterpolatingGraph(idx, vals)
+
+    pts = np.array([0.5, 1.5, 2.5, 3.5]) * u.nm
+    arr = g(pts)
+    for i, p in enumerate(pts):
+        v = g(p)
+        assert np.ndim(v.m) == 0
+        assert v.u == u.m
+        assert v.m == arr.m[i]
+
+    # query points in other units are converted.
+    assert g(0.0025 * u.um).m == pytest.approx(30)
+
+
+def test_interpolating_graph_limits():
+    idx = np.array([1, 2, 3, 4, 5], dtype=np.float64) * u.nm
+    vals = np.array([10, 20, 40, 30, 0], dtype=np.float64) * u.m
+    g = InterpolatingGraph(idx, vals, min_idx=2 * u.nm, max_idx=4 * u.nm)
+
+    assert g.n == 3
+    assert g.d_min == 2 * u.nm
+    assert g.d_max == 4 * u.nm
+
+    # the limits themselves are included.
+    assert g(2 * u.nm).m == 20
+    assert g(4 * u.nm).m == 30
+    # outside of the limits, the first/last value is returned.
+    assert np.all(g(np.array([0, 1, 1.99]) * u.nm).m == 20)
+    assert np.all(g(np.array([4.01, 5, 100]) * u.nm).m == 30)
+    assert g(1 * u.nm).m == 20
+    assert g(5 * u.nm).m == 30
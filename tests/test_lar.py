@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import numpy as np
 import pint
 import pytest
 
@@ -15,3 +16,38 @@ def test_dielectric_constant():
     assert lar.lar_dielectric_constant_cern2020(128 * u.nm) == pytest.approx(
         1.846, rel=1e-3
     )
+
+
+def test_dielectric_constant_empty():
+    empty = np.array([]) * u.nm
+    assert lar.lar_dielectric_constant_bideau_mehu(empty).shape == (0,)
+    assert lar.lar_dielectric_constant_cern2020(empty).shape == (0,)
+    assert lar.lar_dielectric_constant(empty).shape == (0,)
+
+
+def test_dielectric_constant_range():
+    with pytest.raises(ValueError):
+        lar.lar_dielectric_constant_bideau_mehu(np.array([100, 128]) * u.nm)
+    with pytest.raises(ValueError):
+        lar.lar_dielectric_constant_cern2020(np.array([128, 1000]) * u.nm)
+
+
+def test_rayleigh_refractive_index_empty():
+    empty = np.array([]) * u.nm
+    assert lar.lar_refractive_index(empty).shape == (0,)
+    assert lar.lar_rayleigh(empty).shape == (0,)
+
+
+def test_constant_getters_not_shared():
+    # in-place conversions of a returned quantity must not affect later calls.
+    lar.lar_lifetimes().singlet.ito("us")
+    assert lar.lar_lifetimes().singlet.u == u.ns
+    lar.lar_peak_attenuation_length().ito("m")
+    assert lar.lar_peak_attenuation_length().u == u.cm
+
+
+def test_dielectric_constant_not_shared():
+    ϵ = lar.lar_dielectric_constant(128 * u.nm)
+    ϵ.ito("percent")
+    assert lar.lar_dielectric_constant(128 * u.nm).u == u.dimensionless
+    assert lar.lar_dielectric_constant(128 * u.nm).m == pytest.approx(ϵ.m / 100)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pint
 import pyg4ometry.geant4 as g4
 
@@ -89,3 +90,47 @@ def test_pyg4_attach_pen() -> None:
     legendoptics.pen.pyg4_pen_attach_attenuation(mat, reg)
     legendoptics.pen.pyg4_pen_attach_wls(mat, reg)
     legendoptics.pen.pyg4_pen_attach_scintillation(mat, reg)
+
+
+def _property_values(mat: g4.Material, name: str) -> np.ndarray:
+    # the matrix holds (energy, value) pairs.
+    return np.asarray(mat.properties[name].eval()).reshape(-1, 2)[:, 1]
+
+
+def test_pyg4_attach_pen_replaced() -> None:
+    import legendoptics.pen
+    from legendoptics import store
+
+    # attach the original properties first, to fill all caches.
+    reg, mat = _create_dummy_mat()
+    legendoptics.pen.pyg4_pen_attach_attenuation(mat, reg)
+    legendoptics.pen.pyg4_pen_attach_wls(mat, reg)
+    legendoptics.pen.pyg4_pen_attach_scintillation(mat, reg)
+    assert np.unique(_property_values(mat, "ABSLENGTH")).shape[0] > 2
+    assert np.unique(_property_values(mat, "WLSCOMPONENT")).shape[0] > 2
+    # the interpolation graph of the original spectrum is reused.
+    graph = legendoptics.pen._pen_wls_emission_graph()
+    assert legendoptics.pen._pen_wls_emission_graph() is graph
+
+    λ = np.array([300, 700]) * u.nm
+    legendoptics.pen.pen_absorption.replace_implementation(
+        lambda: (λ, np.array([5, 5]) * u.m)
+    )
+    legendoptics.pen.pen_wls_emission.replace_implementation(
+        lambda: (λ, np.array([1, 1]) * u.dimensionless)
+    )
+    try:
+        reg, mat = _create_dummy_mat()
+        legendoptics.pen.pyg4_pen_attach_attenuation(mat, reg)
+        legendoptics.pen.pyg4_pen_attach_wls(mat, reg)
+        legendoptics.pen.pyg4_pen_attach_scintillation(mat, reg)
+    finally:
+        store.reset_all_to_original()
+
+    # the replaced (flat) spectra are used, apart from the modified boundary values.
+    assert np.unique(_property_values(mat, "ABSLENGTH")).shape[0] == 2
+    for name in ("WLSCOMPONENT", "SCINTILLATIONCOMPONENT1"):
+        em = _property_values(mat, name)
+        assert np.all(em[1:-1] == 1)
+        assert em[0] == 0
+        assert em[-1] == 0
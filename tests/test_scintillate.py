@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import numpy as np
 import pint
+import pytest
 
 from legendoptics import lar, pen
 from legendoptics import scintillate as sc
@@ -43,3 +44,123 @@ def test_scintillate_pen():
 
     sc.scintillate_local(params, part_e, 10, rng)
     sc.scintillate_local(params, part_ion, 10, rng)
+
+
+def test_scintillate_batch():
+    params = sc.precompute_scintillation_params(
+        lar.lar_scintillation_params(),
+        lar.lar_lifetimes().as_tuple(),
+    )
+    part_e = sc.particle_to_index("electron")
+    part_ion = sc.particle_to_index("ion")
+
+    x0 = np.array([[0, 0, 0], [1, 1, 1], [0, 0, 0], [0, 0, 1]], dtype=np.float64)
+    x1 = np.array([[0, 0, 1], [1, 2, 1], [1, 0, 0], [0, 0, 2]], dtype=np.float64)
+    v0 = np.full(4, 0.1)
+    v1 = np.full(4, 0.09)
+    t0 = np.array([0, 10, 1234.5, 5])
+    parts = np.array([part_e, part_ion, part_e, part_e])
+    charges = np.array([-1, -1, 0, -1])
+    edep = np.array([1000, 1000, 100, 0], dtype=np.float64)
+
+    x, offsets = sc.scintillate_batch(
+        params, x0, x1, v0, v1, t0, parts, charges, edep, np.random.default_rng(42)
+    )
+    assert offsets.shape == (5,)
+    assert offsets[0] == 0
+    assert offsets[-1] == x.shape[0]
+    assert x.shape[1] == 4
+    # no photons for a step without energy deposition.
+    assert offsets[4] == offsets[3]
+
+    # the result is the same as for single calls with the same random numbers.
+    rng = np.random.default_rng(42)
+    for i in range(4):
+        x_step = sc.scintillate(
+            params,
+            x0[i],
+            x1[i],
+            v0[i],
+            v1[i],
+            t0[i],
+            parts[i],
+            charges[i],
+            edep[i],
+            rng,
+        )
+        assert np.array_equal(x[offsets[i] : offsets[i + 1]], x_step)
+
+    for i in range(3):
+        x_step = x[offsets[i] : offsets[i + 1]]
+        assert x_step.shape[0] > 0
+        # all photons are emitted after the step start.
+        assert np.all(x_step[:, 0] >= t0[i])
+        # all photons are emitted on the line segment between x0 and x1.
+        d = x1[i] - x0[i]
+        λ = (x_step[:, 1:] - x0[i]) @ d / (d @ d)
+        assert np.all((λ >= 0) & (λ <= 1))
+        assert np.allclose(x0[i] + λ[:, np.newaxis] * d, x_step[:, 1:])
+    # uncharged particles emit at the step end.
+    assert np.allclose(x[offsets[2] : offsets[3], 1:], x1[2])
+
+    # mismatched step array lengths are rejected.
+    with pytest.raises(ValueError, match="same length"):
+        sc.scintillate_batch(
+            params,
+            x0,
+            x1[:3],
+            v0,
+            v1,
+            t0,
+            parts,
+            charges,
+            edep,
+            np.random.default_rng(),
+        )
+    with pytest.raises(ValueError, match="same length"):
+        sc.scintillate_batch(
+            params,
+            x0,
+            x1,
+            v0,
+            v1,
+            t0,
+            parts[:3],
+            charges,
+            edep,
+            np.random.default_rng(),
+        )
+
+
+def test_scintillate_at_rest():
+    params = sc.precompute_scintillation_params(
+        lar.lar_scintillation_params(),
+        lar.lar_lifetimes().as_tuple(),
+    )
+    part_e = sc.particle_to_index("electron")
+
+    x0 = np.array([0, 0, 0], dtype=np.float64)
+    x1 = np.array([0, 0, 1], dtype=np.float64)
+    rng = np.random.default_rng(42)
+
+    # a particle at rest results in infinite photon times, not in an error.
+    for charge in (-1, 0):
+        x = sc.scintillate(params, x0, x1, 0.0, 0.0, 0.0, part_e, charge, 1000, rng)
+        assert x.shape[0] > 0
+        assert np.all(np.isposinf(x[:, 0]))
+        assert np.all(np.isfinite(x[:, 1:]))
+
+    x, _ = sc.scintillate_batch(
+        params,
+        x0[np.newaxis],
+        x1[np.newaxis],
+        np.zeros(1),
+        np.zeros(1),
+        np.zeros(1),
+        np.array([part_e]),
+        np.array([-1]),
+        np.array([1000.0]),
+        rng,
+    )
+    assert x.shape[0] > 0
+    assert np.all(np.isposinf(x[:, 0]))
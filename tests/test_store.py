@@ -15,6 +15,7 @@ def test_store():
     fiber_core_refractive_index.replace_implementation(lambda: 1234)
     assert fiber_core_refractive_index() == 1234
     assert not fiber_core_refractive_index.is_original()
+    assert fiber_core_refractive_index.current_impl()() == 1234
 
     fiber_cladding1_refractive_index.replace_implementation(lambda: 1)
 
@@ -22,6 +23,10 @@ def test_store():
     fiber_core_refractive_index.reset_implementation()
     assert fiber_core_refractive_index() == 1.6
     assert fiber_core_refractive_index.is_original()
+    assert (
+        fiber_core_refractive_index.current_impl()
+        is fiber_core_refractive_index.original_impl()
+    )
     # ... other properties are not reset:
     assert not store.is_all_original()
     assert fiber_cladding1_refractive_index() == 1